@@ -7,16 +7,39 @@ Expone endpoints de lectura sobre el modelo organizacional sintético
 a partir de los datos almacenados en el Data Lake de Azure.
 """
 
+import hashlib
 import os
-from io import BytesIO
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
+import orjson
 import pandas as pd
-from fastapi import FastAPI, HTTPException, Query
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from fastapi import FastAPI, HTTPException, Query, Response
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from azure.storage.blob import BlobServiceClient
 
+
+class ORJSONResponse(Response):
+    """
+    Respuesta JSON serializada con orjson (ruta en C, soporta tipos NumPy).
+    Devolverla directamente desde los endpoints evita el paso por
+    jsonable_encoder y la re-validación de pydantic de FastAPI.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 # ---------------------------------------------------------------------
 # Configuración y carga de datos
 # ---------------------------------------------------------------------
@@ -33,28 +56,80 @@ if not CONN_STR:
         "AZURE_STORAGE_CONNECTION_STRING no está definido en el entorno."
     )
 
-blob_service = BlobServiceClient.from_connection_string(CONN_STR)
+# Tamaños de transferencia ajustados para descargas de blobs medianos:
+# una sola operación GET hasta 32 MB y chunks de 4 MB por encima.
+blob_service = BlobServiceClient.from_connection_string(
+    CONN_STR,
+    max_single_get_size=32 * 1024 * 1024,
+    max_chunk_get_size=4 * 1024 * 1024,
+)
 container_client = blob_service.get_container_client(CONTAINER_NAME)
 
 
-def _load_parquet_from_datalake(prefix: str, filename: str) -> pd.DataFrame:
+def _load_parquet_from_datalake(
+    prefix: str,
+    filename: str,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
     """
     Lee un archivo Parquet desde el Data Lake y lo devuelve como DataFrame.
+
+    Si se indica `columns`, solo se decodifican los column chunks
+    correspondientes (proyección sobre el layout columnar de Parquet),
+    reduciendo CPU de descompresión y memoria pico.
+
+    La descarga se consume por chunks hacia un buffer nativo de Arrow
+    en lugar de readall(), evitando duplicar el blob completo en bytes
+    de Python antes del parseo.
     """
     blob_path = f"{BASE_PREFIX}/{prefix}/{filename}"
     blob_client = container_client.get_blob_client(blob_path)
-    data_bytes = blob_client.download_blob().readall()
-    return pd.read_parquet(BytesIO(data_bytes))
+    stream = blob_client.download_blob(max_concurrency=4)
+
+    buf = pa.BufferOutputStream()
+    for chunk in stream.chunks():
+        buf.write(chunk)
+
+    return pq.read_table(
+        pa.BufferReader(buf.getvalue()), columns=columns
+    ).to_pandas()
 
 
 def _build_org_view() -> pd.DataFrame:
     """
     Construye la vista integrada de organización (employees + job_positions + departments)
     a partir de los archivos Parquet almacenados en el Data Lake.
+
+    Cada tabla se proyecta a las columnas que los endpoints realmente
+    consumen aguas abajo, y las tres descargas se lanzan en paralelo
+    para solapar la latencia de red de cada blob.
     """
-    departments_df = _load_parquet_from_datalake("departments", "departments.parquet")
-    job_positions_df = _load_parquet_from_datalake("job_positions", "job_positions.parquet")
-    employees_df = _load_parquet_from_datalake("employees", "employees.parquet")
+    table_columns = {
+        "departments": ["department_id", "department_name"],
+        "job_positions": ["job_position_id", "position_name"],
+        "employees": [
+            "employee_id",
+            "department_id",
+            "job_position_id",
+            "seniority_level",
+            "age",
+            "tenure_years",
+            "salary",
+        ],
+    }
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            name: executor.submit(
+                _load_parquet_from_datalake, name, f"{name}.parquet", cols
+            )
+            for name, cols in table_columns.items()
+        }
+        dfs = {name: future.result() for name, future in futures.items()}
+
+    departments_df = dfs["departments"]
+    job_positions_df = dfs["job_positions"]
+    employees_df = dfs["employees"]
 
     # Unión employees + job_positions
     employees_positions = employees_df.merge(
@@ -85,11 +160,243 @@ def _build_org_view() -> pd.DataFrame:
         if col in org_view.columns:
             org_view[col] = org_view[col].astype(float).round(2)
 
+    # Alias de columnas de puesto para el contrato de la API
+    # (los datos fuente usan position_name / seniority_level)
+    if "job_title" not in org_view.columns and "position_name" in org_view.columns:
+        org_view["job_title"] = org_view["position_name"]
+    if "job_level" not in org_view.columns and "seniority_level" in org_view.columns:
+        org_view["job_level"] = org_view["seniority_level"]
+
+    # Entero nullable para conservar posibles valores faltantes de edad
+    if "age" in org_view.columns:
+        org_view["age"] = org_view["age"].astype("Int64")
+
+    # Columnas de baja cardinalidad como category: comparaciones y
+    # groupby sobre códigos int8 en lugar de objetos Python, y ~1 byte
+    # por fila en memoria en vez de un PyObject por celda.
+    for col in ("job_level", "department_name", "seniority_level", "department_type"):
+        if col in org_view.columns:
+            org_view[col] = org_view[col].astype("category")
+
     return org_view
 
 
-# Se construye la vista en memoria al iniciar el servicio
-ORG_VIEW: pd.DataFrame = _build_org_view()
+def _default_cache_dir() -> Path:
+    """
+    Directorio por defecto del caché de la vista. Se prefiere /dev/shm
+    cuando existe: al abrir el archivo memory-mapped desde varios
+    workers de uvicorn, los buffers de columnas se comparten vía page
+    cache y el RSS total queda en ~1x el dataset en lugar de Nx.
+    """
+    shm = Path("/dev/shm")
+    return shm if shm.is_dir() else Path(tempfile.gettempdir())
+
+
+# Directorio del caché local de la vista materializada (Arrow IPC)
+_CACHE_DIR = Path(os.getenv("ORG_VIEW_CACHE_DIR") or _default_cache_dir())
+
+_TABLE_NAMES = ("departments", "job_positions", "employees")
+
+
+def _org_view_cache_path() -> Path:
+    """
+    Ruta del caché local de la vista, keyed por los etags de los blobs
+    remotos: si algún Parquet cambia en el Data Lake, cambia el etag y
+    por tanto el archivo de caché a usar.
+    """
+    etags = {
+        name: container_client.get_blob_client(
+            f"{BASE_PREFIX}/{name}/{name}.parquet"
+        ).get_blob_properties().etag
+        for name in _TABLE_NAMES
+    }
+    key = hashlib.sha1(str(sorted(etags.items())).encode()).hexdigest()
+    return _CACHE_DIR / f"org_view_{key}.arrow"
+
+
+def _load_org_table() -> pa.Table:
+    """
+    Obtiene la vista integrada como tabla Arrow.
+
+    Con caché local vigente, el arranque evita la descarga y el decode
+    de Parquet: el archivo IPC se abre memory-mapped y la lectura es
+    cuestión de milisegundos. Si no hay caché, se construye la vista
+    desde el Data Lake y se persiste para los siguientes arranques.
+    """
+    cache_path = _org_view_cache_path()
+
+    if not cache_path.exists():
+        org_view = _build_org_view().sort_values("employee_id").reset_index(drop=True)
+        table = pa.Table.from_pandas(org_view, preserve_index=False)
+
+        # Escritura atómica: se escribe a un temporal propio del proceso
+        # y os.replace publica el archivo completo. Si varios workers
+        # arrancan a la vez, cada uno publica contenido equivalente y
+        # ninguno observa un archivo a medio escribir.
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, cache_path)
+
+    # Lectura memory-mapped: los buffers de columnas quedan respaldados
+    # por el page cache del kernel y se comparten entre workers.
+    return pa.ipc.open_file(pa.memory_map(str(cache_path))).read_all()
+
+
+# Columnas expuestas por los endpoints de empleados, en el orden
+# que esperan los constructores de respuesta.
+_EMP_COLS = [
+    "employee_id",
+    "department_id",
+    "department_name",
+    "job_position_id",
+    "job_title",
+    "job_level",
+    "salary",
+    "tenure_years",
+    "age",
+]
+
+# Estado derivado de la vista integrada; se materializa en el hook
+# lifespan de la aplicación, no al importar el módulo.
+ORG_VIEW: pd.DataFrame = None
+_ORG_TABLE: pa.Table = None
+_JOB_LEVEL_CODES = None
+_JOB_LEVEL_CATS = None
+_SALARY = None
+_EMP_ARRAYS = None
+_EMP_INDEX = None
+_DEPARTMENTS_JSON: bytes = b""
+_SALARY_SUMMARY_JSON: bytes = b""
+
+
+def _init_state(table: pa.Table) -> None:
+    """
+    Materializa las estructuras derivadas de la vista integrada:
+
+    - la tabla Arrow proyectada que filtran los endpoints de listado,
+    - los arrays columnares y el índice hash para el lookup puntual,
+    - las respuestas estáticas pre-serializadas.
+    """
+    global ORG_VIEW, _ORG_TABLE, _JOB_LEVEL_CODES, _JOB_LEVEL_CATS
+    global _SALARY, _EMP_ARRAYS, _EMP_INDEX
+    global _DEPARTMENTS_JSON, _SALARY_SUMMARY_JSON
+
+    ORG_VIEW = table.to_pandas()
+
+    # Tabla Arrow con la proyección de empleados: los filtros de
+    # /employees corren como kernels vectorizados (SIMD) del engine
+    # C++ de Arrow sobre buffers columnares, sin pandas por petición.
+    # Las columnas dictionary (category en pandas) se decodifican una
+    # sola vez aquí: los kernels de comparación no siempre tienen
+    # variante dictionary y la proyección es pequeña.
+    projected = table.select(_EMP_COLS)
+    columns = []
+    for name in projected.column_names:
+        col = projected[name]
+        if pa.types.is_dictionary(col.type):
+            col = col.cast(col.type.value_type)
+        columns.append(col)
+    _ORG_TABLE = pa.table(dict(zip(projected.column_names, columns)))
+
+    # Arrays auxiliares para el lookup puntual y los agregados
+    _JOB_LEVEL_CODES, _JOB_LEVEL_CATS = pd.factorize(ORG_VIEW["job_level"])
+    _SALARY = ORG_VIEW["salary"].to_numpy(np.float64)
+    _EMP_ARRAYS = {col: ORG_VIEW[col].to_numpy() for col in _EMP_COLS}
+
+    # Índice hash employee_id -> posición de fila, para búsqueda O(1)
+    # en /employees/{id} sin escanear la vista completa.
+    _EMP_INDEX = {
+        int(eid): i for i, eid in enumerate(ORG_VIEW["employee_id"].to_numpy())
+    }
+
+    # El dataset no muta en runtime: ambos agregados se calculan y se
+    # serializan una sola vez; cada petición devuelve los bytes listos.
+    _DEPARTMENTS_JSON = orjson.dumps(_build_departments_payload())
+    _SALARY_SUMMARY_JSON = orjson.dumps(_build_salary_summary_payload())
+
+
+def _employee_record(tup) -> dict:
+    """
+    Convierte una tupla en el orden de _EMP_COLS en un dict de respuesta.
+
+    salary y tenure_years llegan ya redondeados a dos decimales desde
+    _build_org_view, por lo que no se re-redondean por fila.
+    """
+    return {
+        "employee_id": int(tup[0]),
+        "department_id": int(tup[1]),
+        "department_name": tup[2],
+        "job_position_id": int(tup[3]),
+        "job_title": tup[4],
+        "job_level": tup[5],
+        "salary": float(tup[6]),
+        "tenure_years": float(tup[7]),
+        "age": int(tup[8]) if not pd.isna(tup[8]) else None,
+    }
+
+
+def _build_departments_payload() -> list:
+    """Calcula el listado de departamentos con su headcount."""
+    headcount = (
+        ORG_VIEW.groupby(["department_id", "department_name"], observed=True)
+        .size()
+        .reset_index(name="headcount")
+        .sort_values("headcount", ascending=False)
+    )
+    return [
+        {
+            "department_id": int(dept_id),
+            "department_name": dept_name,
+            "headcount": int(count),
+        }
+        for dept_id, dept_name, count in headcount.itertuples(index=False, name=None)
+    ]
+
+
+def _build_salary_summary_payload() -> dict:
+    """
+    Calcula el resumen de salarios por nivel y los agregados globales.
+
+    Los agregados por nivel se obtienen en una sola pasada O(N) sobre
+    el array contiguo de salarios usando los códigos factorizados de
+    job_level (bincount + ufunc.at), sin groupby de pandas.
+    """
+    # Los códigos -1 corresponden a job_level nulo y se excluyen,
+    # igual que hacía groupby
+    valid = _JOB_LEVEL_CODES >= 0
+    codes = _JOB_LEVEL_CODES[valid]
+    salary = _SALARY[valid]
+
+    n_levels = len(_JOB_LEVEL_CATS)
+    counts = np.bincount(codes, minlength=n_levels)
+    sums = np.bincount(codes, weights=salary, minlength=n_levels)
+
+    mins = np.full(n_levels, np.inf)
+    maxs = np.full(n_levels, -np.inf)
+    np.minimum.at(mins, codes, salary)
+    np.maximum.at(maxs, codes, salary)
+
+    # Orden alfabético por nivel, como devolvía groupby
+    levels = [
+        {
+            "job_level": _JOB_LEVEL_CATS[k],
+            "avg_salary": round(float(sums[k] / counts[k]), 2),
+            "min_salary": round(float(mins[k]), 2),
+            "max_salary": round(float(maxs[k]), 2),
+            "count": int(counts[k]),
+        }
+        for k in np.argsort(_JOB_LEVEL_CATS)
+        if counts[k]
+    ]
+
+    return {
+        "overall_avg_salary": round(float(_SALARY.mean()), 2),
+        "overall_min_salary": round(float(_SALARY.min()), 2),
+        "overall_max_salary": round(float(_SALARY.max()), 2),
+        "levels": levels,
+    }
 
 
 # ---------------------------------------------------------------------
@@ -133,6 +440,13 @@ class SalarySummaryResponse(BaseModel):
 # Inicialización de la aplicación FastAPI
 # ---------------------------------------------------------------------
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Carga la vista integrada y su estado derivado al arrancar."""
+    _init_state(_load_org_table())
+    yield
+
+
 app = FastAPI(
     title="Organizational Analytics API",
     description=(
@@ -140,6 +454,7 @@ app = FastAPI(
         "construida como parte del Desafío #5 de la prueba técnica MVM."
     ),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -155,7 +470,7 @@ def health_check():
     return {"status": "ok"}
 
 
-@app.get("/employees", response_model=List[EmployeeItem])
+@app.get("/employees", responses={200: {"model": List[EmployeeItem]}})
 def list_employees(
     department_id: Optional[int] = Query(None, description="Filtrar por ID de departamento"),
     job_level: Optional[str] = Query(None, description="Filtrar por nivel del cargo"),
@@ -166,150 +481,46 @@ def list_employees(
     Devuelve un listado paginado de empleados, con filtros opcionales
     por departamento y nivel de cargo.
     """
-    df = ORG_VIEW.copy()
-
-    if department_id is not None and "department_id" in df.columns:
-        df = df[df["department_id"] == department_id]
-
-    if job_level is not None and "job_level" in df.columns:
-        df = df[df["job_level"] == job_level]
+    tbl = _ORG_TABLE
 
-    df = df.sort_values("employee_id").iloc[offset : offset + limit]
+    if department_id is not None:
+        tbl = tbl.filter(pc.equal(tbl["department_id"], department_id))
 
-    items: List[EmployeeItem] = []
-    for _, row in df.iterrows():
-        item = EmployeeItem(
-            employee_id=int(row["employee_id"]),
-            department_id=int(row["department_id"]),
-            department_name=row.get("department_name"),
-            job_position_id=int(row["job_position_id"]),
-            job_title=row.get("job_title"),
-            job_level=row.get("job_level"),
-            salary=round(float(row["salary"]), 2) if "salary" in row else 0.0,
-            tenure_years=round(float(row["tenure_years"]), 2) if "tenure_years" in row else 0.0,
-            age=int(row["age"]) if "age" in row and not pd.isna(row["age"]) else None,
-        )
-        items.append(item)
+    if job_level is not None:
+        tbl = tbl.filter(pc.equal(tbl["job_level"], job_level))
 
-    return items
+    # La tabla ya está ordenada por employee_id; el slice pagina sin
+    # copiar y to_pylist materializa solo los registros de la página,
+    # que se serializan directo con orjson.
+    return ORJSONResponse(tbl.slice(offset, limit).to_pylist())
 
 
-@app.get("/employees/{employee_id}", response_model=EmployeeItem)
+@app.get("/employees/{employee_id}", responses={200: {"model": EmployeeItem}})
 def get_employee(employee_id: int):
     """
     Devuelve la información detallada de un empleado específico.
     """
-    df = ORG_VIEW
-    if "employee_id" not in df.columns:
-        raise HTTPException(status_code=500, detail="Columna employee_id no disponible en el modelo.")
-
-    row = df[df["employee_id"] == employee_id]
-    if row.empty:
+    pos = _EMP_INDEX.get(employee_id)
+    if pos is None:
         raise HTTPException(status_code=404, detail="Empleado no encontrado.")
 
-    r = row.iloc[0]
-
-    return EmployeeItem(
-        employee_id=int(r["employee_id"]),
-        department_id=int(r["department_id"]),
-        department_name=r.get("department_name"),
-        job_position_id=int(r["job_position_id"]),
-        job_title=r.get("job_title"),
-        job_level=r.get("job_level"),
-        salary=round(float(r["salary"]), 2) if "salary" in r else 0.0,
-        tenure_years=round(float(r["tenure_years"]), 2) if "tenure_years" in r else 0.0,
-        age=int(r["age"]) if "age" in r and not pd.isna(r["age"]) else None,
+    return ORJSONResponse(
+        _employee_record(tuple(_EMP_ARRAYS[col][pos] for col in _EMP_COLS))
     )
 
 
-@app.get("/departments", response_model=List[DepartmentSummary])
+@app.get("/departments", responses={200: {"model": List[DepartmentSummary]}})
 def list_departments():
     """
     Devuelve un listado de departamentos junto con su headcount.
     """
-    df = ORG_VIEW
-    required_cols = {"department_id", "department_name"}
-    if not required_cols.issubset(df.columns):
-        raise HTTPException(status_code=500, detail="Columnas de departamentos no disponibles en el modelo.")
-
-    headcount = (
-        df.groupby(["department_id", "department_name"])
-          .size()
-          .reset_index(name="headcount")
-          .sort_values("headcount", ascending=False)
-    )
-
-    items: List[DepartmentSummary] = []
-    for _, row in headcount.iterrows():
-        items.append(
-            DepartmentSummary(
-                department_id=int(row["department_id"]),
-                department_name=row["department_name"],
-                headcount=int(row["headcount"]),
-            )
-        )
-    return items
+    return Response(content=_DEPARTMENTS_JSON, media_type="application/json")
 
 
-@app.get("/analytics/salary-summary", response_model=SalarySummaryResponse)
+@app.get("/analytics/salary-summary", responses={200: {"model": SalarySummaryResponse}})
 def salary_summary():
     """
     Devuelve un resumen analítico de salarios por nivel de puesto,
     con valores agregados redondeados a dos decimales.
     """
-    df = ORG_VIEW
-    if "salary" not in df.columns:
-        raise HTTPException(status_code=500, detail="Columna salary no disponible en el modelo.")
-
-    # Agregados por nivel
-    if "job_level" in df.columns:
-        grouped = (
-            df.groupby("job_level")
-              .agg(
-                  avg_salary=("salary", "mean"),
-                  min_salary=("salary", "min"),
-                  max_salary=("salary", "max"),
-                  count=("salary", "size"),
-              )
-              .reset_index()
-        )
-    else:
-        grouped = (
-            df.assign(job_level="N/A")
-              .groupby("job_level")
-              .agg(
-                  avg_salary=("salary", "mean"),
-                  min_salary=("salary", "min"),
-                  max_salary=("salary", "max"),
-                  count=("salary", "size"),
-              )
-              .reset_index()
-        )
-
-    # Redondeo a dos decimales
-    grouped["avg_salary"] = grouped["avg_salary"].astype(float).round(2)
-    grouped["min_salary"] = grouped["min_salary"].astype(float).round(2)
-    grouped["max_salary"] = grouped["max_salary"].astype(float).round(2)
-
-    levels: List[SalaryLevelSummary] = []
-    for _, row in grouped.iterrows():
-        levels.append(
-            SalaryLevelSummary(
-                job_level=row["job_level"],
-                avg_salary=float(row["avg_salary"]),
-                min_salary=float(row["min_salary"]),
-                max_salary=float(row["max_salary"]),
-                count=int(row["count"]),
-            )
-        )
-
-    overall_avg = round(float(df["salary"].mean()), 2)
-    overall_min = round(float(df["salary"].min()), 2)
-    overall_max = round(float(df["salary"].max()), 2)
-
-    return SalarySummaryResponse(
-        overall_avg_salary=overall_avg,
-        overall_min_salary=overall_min,
-        overall_max_salary=overall_max,
-        levels=levels,
-    )
+    return Response(content=_SALARY_SUMMARY_JSON, media_type="application/json")
@@ -9,10 +9,11 @@ organizados como capa raw versionada.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobServiceClient, ContainerClient
 
 
 # Rutas locales del proyecto
@@ -44,8 +45,17 @@ def load_storage_config():
 
 
 def get_blob_service_client(conn_str: str) -> BlobServiceClient:
-    """Inicializa un BlobServiceClient a partir del connection string."""
-    return BlobServiceClient.from_connection_string(conn_str)
+    """
+    Inicializa un BlobServiceClient a partir del connection string,
+    con tamaños de bloque ajustados para subidas por bloques (staged
+    blocks) en paralelo: bloques de 8 MB y una sola operación PUT
+    hasta 64 MB.
+    """
+    return BlobServiceClient.from_connection_string(
+        conn_str,
+        max_block_size=8 * 1024 * 1024,
+        max_single_put_size=64 * 1024 * 1024,
+    )
 
 
 def iter_raw_files():
@@ -78,8 +88,7 @@ def build_blob_path(base_prefix: str, file_path: Path) -> str:
 
 
 def upload_file(
-    blob_service: BlobServiceClient,
-    container_name: str,
+    container_client: ContainerClient,
     local_path: Path,
     dest_blob_path: str,
     overwrite: bool = True,
@@ -87,22 +96,14 @@ def upload_file(
     """
     Sube un archivo local a Azure Blob Storage.
 
-    Crea el contenedor si no existe y utiliza overwrite=True para
-    permitir ejecuciones repetidas sin duplicar blobs.
+    Asume que el contenedor ya existe (run_batch_upload lo crea una
+    sola vez por corrida) y utiliza overwrite=True para permitir
+    ejecuciones repetidas sin duplicar blobs.
     """
-    container_client = blob_service.get_container_client(container_name)
-
-    try:
-        container_client.create_container()
-        print(f"Contenedor '{container_name}' creado.")
-    except Exception:
-        # Si el contenedor ya existe, se ignora la excepción correspondiente.
-        pass
-
     blob_client = container_client.get_blob_client(dest_blob_path)
 
     with open(local_path, "rb") as f:
-        blob_client.upload_blob(f, overwrite=overwrite)
+        blob_client.upload_blob(f, overwrite=overwrite, max_concurrency=8)
 
     print(f"Subido: {local_path.name} -> {dest_blob_path}")
 
@@ -121,6 +122,14 @@ def run_batch_upload():
     conn_str, container_name, base_prefix = load_storage_config()
     blob_service = get_blob_service_client(conn_str)
 
+    # Creación idempotente del contenedor, una sola vez por corrida
+    # (antes se intentaba crear en cada archivo: un round-trip extra
+    # a Azure por subida).
+    container_client = blob_service.get_container_client(container_name)
+    if not container_client.exists():
+        container_client.create_container()
+        print(f"Contenedor '{container_name}' creado.")
+
     run_timestamp = datetime.utcnow().isoformat()
     print(f"Run timestamp (UTC): {run_timestamp}")
     print(f"Directorio local de origen: {RAW_PATH}")
@@ -133,16 +142,19 @@ def run_batch_upload():
         print("No se encontraron archivos en data/raw para cargar.")
         return
 
-    for file_path in files:
+    def _upload(file_path: Path):
         blob_path = build_blob_path(base_prefix, file_path)
         upload_file(
-            blob_service=blob_service,
-            container_name=container_name,
+            container_client=container_client,
             local_path=file_path,
             dest_blob_path=blob_path,
             overwrite=True,
         )
 
+    # Cada archivo es independiente: se suben varios en paralelo
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        list(executor.map(_upload, files))
+
     print("-" * 60)
     print("Proceso batch completado.")
 
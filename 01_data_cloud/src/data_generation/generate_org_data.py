@@ -13,7 +13,7 @@ utilizando distribuciones de probabilidad sencillas
 pero más realistas que un simple random uniforme.
 """
 
-from datetime import date, timedelta
+from datetime import date
 import numpy as np
 import pandas as pd
 
@@ -60,6 +60,9 @@ def generate_departments() -> pd.DataFrame:
         ]
     )
 
+    # Baja cardinalidad como category: diccionario gratis al persistir
+    departments_df["department_type"] = departments_df["department_type"].astype("category")
+
     return departments_df
 
 
@@ -98,6 +101,10 @@ def generate_job_positions(departments_df: pd.DataFrame) -> pd.DataFrame:
             job_position_id += 1
 
     job_positions_df = pd.DataFrame(job_positions)
+
+    # Baja cardinalidad como category: diccionario gratis al persistir
+    job_positions_df["seniority_level"] = job_positions_df["seniority_level"].astype("category")
+
     return job_positions_df
 
 
@@ -160,42 +167,37 @@ def generate_dates_from_age_and_tenure(
       mínima aproximada de 18 años, usando un desplazamiento de 18*365 días
       sobre la fecha de nacimiento. Esta aproximación evita problemas con
       años bisiestos y es suficiente para el contexto de datos sintéticos.
+
+    Todo el cálculo es vectorizado sobre arrays datetime64[D], usando la
+    misma aproximación de años de 365 días que el criterio 18*365; no hay
+    bucles Python por empleado.
     """
     size = len(ages)
-    today = date.today()
-
-    birth_dates = []
-    hire_dates = []
-
-    for i in range(size):
-        age = int(ages[i])
-        tenure = int(tenure_years[i])
-
-        # Año aproximado de nacimiento e ingreso
-        birth_year = today.year - age
-        hire_year = today.year - tenure
-
-        # Día aleatorio dentro del año
-        birth_day_of_year = int(np.random.randint(1, 365))
-        hire_day_of_year = int(np.random.randint(1, 365))
+    jan_first = np.datetime64(date(date.today().year, 1, 1), "D")
 
-        birth_date = date(birth_year, 1, 1) + timedelta(
-            days=birth_day_of_year
-        )
-        hire_date = date(hire_year, 1, 1) + timedelta(
-            days=hire_day_of_year
-        )
+    # Días aleatorios dentro del año, generados de una sola vez con el
+    # Generator sembrado del módulo (reproducible con RANDOM_SEED)
+    birth_day_of_year = rng.integers(1, 365, size)
+    hire_day_of_year = rng.integers(1, 365, size)
 
-        # Edad laboral mínima aproximada: 18 años
-        min_hire_date = birth_date + timedelta(days=18 * 365)
+    year_days = np.timedelta64(365, "D")
+    one_day = np.timedelta64(1, "D")
 
-        if hire_date < min_hire_date:
-            hire_date = min_hire_date
+    birth_dates = (
+        jan_first
+        - ages.astype(np.int64) * year_days
+        + birth_day_of_year * one_day
+    )
+    hire_dates = (
+        jan_first
+        - tenure_years.astype(np.int64) * year_days
+        + hire_day_of_year * one_day
+    )
 
-        birth_dates.append(birth_date)
-        hire_dates.append(hire_date)
+    # Edad laboral mínima aproximada: 18 años
+    hire_dates = np.maximum(hire_dates, birth_dates + 18 * 365 * one_day)
 
-    return np.array(birth_dates), np.array(hire_dates)
+    return birth_dates, hire_dates
 
 
 def generate_salary(levels: np.ndarray,
@@ -206,47 +208,40 @@ def generate_salary(levels: np.ndarray,
     ajustada por nivel de seniority y por departamento.
     La unidad puede interpretarse como salario mensual o anual,
     según se defina más adelante.
+
+    Los factores se resuelven de forma vectorizada: una tabla de
+    factores indexada por código de seniority y otra por department_id,
+    seguidas de un único producto elemento a elemento.
     """
 
     size = len(levels)
 
-    # factores por nivel de seniority
-    level_factor = {
-        "Junior": 0.8,
-        "SemiSenior": 1.0,
-        "Senior": 1.3,
-        "Lead": 1.6,
-        "Manager": 2.0,
-    }
+    # factores por nivel de seniority (mismo orden que las categorías)
+    seniority_levels = ["Junior", "SemiSenior", "Senior", "Lead", "Manager"]
+    level_factor_arr = np.array([0.8, 1.0, 1.3, 1.6, 2.0])
+
+    level_codes = pd.Categorical(levels, categories=seniority_levels).codes
+    lf = np.where(level_codes >= 0, level_factor_arr[level_codes], 1.0)
 
-    # factores por tipo de departamento (simple pero razonable)
+    # factores por tipo de departamento (simple pero razonable),
+    # materializados como un factor por department_id
     dept_type_factor = {
         "Core": 1.10,
         "Corporate": 1.00,
         "Support": 0.95,
     }
-
-    # mapa department_id -> tipo
-    dept_types = (
-        departments_df.set_index("department_id")["department_type"].to_dict()
+    dept_factor_by_id = (
+        departments_df.set_index("department_id")["department_type"]
+        .map(dept_type_factor)
+        .fillna(1.0)
     )
+    dt = dept_factor_by_id.reindex(department_ids).to_numpy()
 
     # base log-normal (no centrada en valores monetarios específicos;
     # posteriormente se puede interpretar como miles de unidades)
     base = rng.lognormal(mean=8.5, sigma=0.5, size=size)
 
-    salaries = []
-    for i in range(size):
-        lvl = levels[i]
-        dept_id = int(department_ids[i])
-
-        lf = level_factor.get(lvl, 1.0)
-        dt = dept_type_factor.get(dept_types.get(dept_id, "Corporate"), 1.0)
-
-        salary_value = base[i] * lf * dt
-        salaries.append(salary_value)
-
-    return np.array(salaries)
+    return base * lf * dt
 
 
 # ---------------------------------------------------------------------------
@@ -281,10 +276,10 @@ def generate_employees(
         seniority_levels, size=n_employees, p=seniority_probs
     )
 
-    # 2) Selección de puesto compatible con dept + nivel
-    job_positions_df = job_positions_df.copy()
-
-    # índice auxiliar para búsquedas rápidas
+    # 2) Selección de puesto compatible con dept + nivel (vectorizada):
+    # cada combinación (departamento, nivel) define un grupo con su
+    # array de puestos candidatos; el sorteo por empleado se reduce a
+    # un único rng.integers sobre los tamaños de grupo.
     grouped_positions = (
         job_positions_df.groupby(
             ["department_id", "seniority_level"]
@@ -292,21 +287,35 @@ def generate_employees(
         .apply(list)
         .to_dict()
     )
+    positions_by_dept = (
+        job_positions_df.groupby("department_id")["job_position_id"]
+        .apply(list)
+        .to_dict()
+    )
 
-    job_position_ids = []
-    for dept_id, level in zip(employee_department_ids, employee_seniority):
-        key = (int(dept_id), level)
-        candidates = grouped_positions.get(key)
-
-        if not candidates:
-            # Si por alguna razón no hay puesto exacto, elegir cualquiera del depto
-            candidates = job_positions_df[
-                job_positions_df["department_id"] == dept_id
-            ]["job_position_id"].tolist()
-
-        job_position_ids.append(rng.choice(candidates))
-
-    job_position_ids = np.array(job_position_ids)
+    n_levels = len(seniority_levels)
+    candidates_per_group = []
+    sizes_per_group = []
+    for dept_id in dept_ids:
+        for level in seniority_levels:
+            # Si por alguna razón no hay puesto exacto, cualquiera del depto
+            candidates = (
+                grouped_positions.get((int(dept_id), level))
+                or positions_by_dept.get(int(dept_id), [])
+            )
+            candidates_per_group.append(np.asarray(candidates))
+            sizes_per_group.append(len(candidates))
+    sizes_per_group = np.array(sizes_per_group)
+
+    seniority_codes = pd.Categorical(
+        employee_seniority, categories=seniority_levels
+    ).codes
+    group_ids = (employee_department_ids - 1) * n_levels + seniority_codes
+
+    picks = rng.integers(0, sizes_per_group[group_ids])
+    job_position_ids = np.array(
+        [candidates_per_group[g][p] for g, p in zip(group_ids, picks)]
+    )
 
     # 3) Edad, antigüedad y fechas
     ages = generate_age(n_employees)
@@ -335,25 +344,25 @@ def generate_employees(
     employee_first_names = rng.choice(first_names, size=n_employees)
     employee_last_names = rng.choice(last_names, size=n_employees)
 
-    employees = []
-    for i in range(n_employees):
-        employees.append(
-            {
-                "employee_id": i + 1,
-                "first_name": employee_first_names[i],
-                "last_name": employee_last_names[i],
-                "department_id": int(employee_department_ids[i]),
-                "job_position_id": int(job_position_ids[i]),
-                "seniority_level": employee_seniority[i],
-                "birth_date": birth_dates[i],
-                "hire_date": hire_dates[i],
-                "age": int(ages[i]),
-                "tenure_years": int(tenure_years[i]),
-                "salary": float(salaries[i]),
-            }
-        )
-
-    employees_df = pd.DataFrame(employees)
+    # 6) Construcción columnar del DataFrame a partir de los arrays ya
+    # materializados (sin dicts por fila) y con dtypes compactos.
+    employees_df = pd.DataFrame(
+        {
+            "employee_id": np.arange(1, n_employees + 1, dtype=np.int64),
+            "first_name": employee_first_names,
+            "last_name": employee_last_names,
+            "department_id": employee_department_ids.astype(np.int32),
+            "job_position_id": job_position_ids.astype(np.int32),
+            "seniority_level": pd.Categorical(
+                employee_seniority, categories=seniority_levels
+            ),
+            "birth_date": birth_dates,
+            "hire_date": hire_dates,
+            "age": ages.astype(np.int16),
+            "tenure_years": tenure_years.astype(np.int16),
+            "salary": salaries.astype(np.float32),
+        }
+    )
     return employees_df
 
 